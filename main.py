@@ -1,33 +1,78 @@
 import sys
 import os
+import json
+import functools
 import subprocess
 import zipfile
 import shutil
-import requests  # For downloading ffmpeg if needed
+import struct
+import hashlib
+import collections
+import tempfile
 from io import BytesIO
-from PyQt5 import QtWidgets, QtGui, QtCore
-from PIL import Image
-from urllib.request import urlopen, Request  # For downloading images in Credits tab
+from PyQt5 import QtWidgets, QtGui, QtCore, QtNetwork
+from PIL import Image, ImageOps
+
+# Image.Resampling is Pillow >= 9.1; the bare constants were removed in Pillow 10
+LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+# Optional dependencies are imported on first use rather than at startup;
+# OpenCV alone pulls in a ~60 MB library and numpy adds ~100 ms of imports.
 
 # If you want fallback to OpenCV for video durations
-try:
-    import cv2
-except ImportError:
-    cv2 = None
+@functools.lru_cache(maxsize=None)
+def load_cv2():
+    try:
+        import cv2
+        return cv2
+    except ImportError:
+        return None
 
 # If you want fallback to Mutagen for audio durations
-try:
-    from mutagen import File as MutagenFile
-except ImportError:
-    MutagenFile = None
+@functools.lru_cache(maxsize=None)
+def load_mutagen_file():
+    try:
+        from mutagen import File as MutagenFile
+        return MutagenFile
+    except ImportError:
+        return None
+
+# If you want faster (GIL-releasing) JPEG encodes in the target-size search
+@functools.lru_cache(maxsize=None)
+def load_turbo_jpeg():
+    try:
+        from turbojpeg import TurboJPEG
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return None
+
+# If you want the target-size search to stop at a perceptually lossless quality (pyssim)
+@functools.lru_cache(maxsize=None)
+def load_compute_ssim():
+    try:
+        from ssim import compute_ssim
+        return compute_ssim
+    except ImportError:
+        return None
+
+# If you want those SSIM probes JIT-compiled instead (numba, see ssim_numba.py)
+@functools.lru_cache(maxsize=None)
+def load_ssim_numba():
+    try:
+        import ssim_numba
+        return ssim_numba
+    except Exception as e:
+        # numba raises its own errors (not ImportError) when a kernel fails to compile
+        if not isinstance(e, ImportError):
+            print("numba SSIM kernel unavailable, falling back to pyssim:", e)
+        return None
+
+# If you want lossless JPEG optimization (jpegtran ships with libjpeg-turbo and mozjpeg)
+jpegtran_exe = shutil.which("jpegtran")
 
 # Set the OpenGL context attribute for Qt WebEngine before creating the QApplication
 QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
 
-# Multimedia imports for video/audio preview
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from PyQt5.QtMultimediaWidgets import QVideoWidget
-
 # -------------------------------
 # Custom error dialog (for copyable error messages)
 # -------------------------------
@@ -44,127 +89,819 @@ def show_error_dialog(title, error_text):
     layout.addWidget(button_box)
     dialog.exec_()
 
+# Don't allocate a console window for every ffmpeg/ffprobe child on Windows
+SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform.startswith("win") else 0
+
 # -------------------------------
 # 1. Download / unpack ffmpeg if not present
 # -------------------------------
-def ensure_ffmpeg_exists(ffmpeg_folder="ffmpeg_bin"):
+def ffmpeg_runs(ffmpeg_path):
     """
-    Checks if ffmpeg.exe and ffprobe.exe exist in ffmpeg_folder.
-    If not, downloads a portable build from a known URL and extracts them.
+    True if ffmpeg_path is a working ffmpeg; an interrupted download can leave a truncated exe behind.
+    """
+    try:
+        result = subprocess.run([ffmpeg_path, "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                timeout=5, creationflags=SUBPROCESS_FLAGS)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return result.returncode == 0
+
+# Pinned ffmpeg build: gyan.dev's 6.0 essentials build (ffmpeg.exe and ffprobe.exe), as shipped
+# in the ffmpeg-binaries 1.1.0 Windows wheel. Files on PyPI can't be replaced under the same name,
+# and the archive must match FF_SHA256, which lives here rather than on the download host so a
+# compromised mirror can't serve a matching checksum. Update both together when bumping.
+FF_VERSION = "6.0"
+FF_URL = ("https://files.pythonhosted.org/packages/00/ba/b3b0bc096cf3662a7a771976145d060e6fdc5d51360d18adfc918ebdd017/"
+          "ffmpeg_binaries-1.1.0-py3-none-win_amd64.whl")
+# SHA-256 of the archive above, as lowercase hex
+FF_SHA256 = "8d5fbaf2d28fcc72e8d2c22628977cf8863641592c9ec15358290490f9195b9e"
+
+def ensure_ffmpeg_exists(ffmpeg_folder="ffmpeg_bin", progress=None):
+    """
+    Checks if ffmpeg.exe and ffprobe.exe exist in ffmpeg_folder and ffmpeg runs.
+    If not, downloads the pinned build from FF_URL, verifies it against FF_SHA256
+    and extracts them. Raises RuntimeError, without installing anything, if the
+    checksum doesn't match.
+    progress(received, total) is called after every downloaded chunk; total is 0
+    when the server doesn't send a Content-Length.
     Returns the paths to ffmpeg_exe and ffprobe_exe.
-    NOTE: Replace the FF_URL below with a stable, trusted link to a Windows build of ffmpeg.
     """
-    FF_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
-
     ffmpeg_path = os.path.join(ffmpeg_folder, "ffmpeg.exe")
     ffprobe_path = os.path.join(ffmpeg_folder, "ffprobe.exe")
 
-    if not os.path.exists(ffmpeg_path) or not os.path.exists(ffprobe_path):
+    if not os.path.exists(ffmpeg_path) or not os.path.exists(ffprobe_path) or not ffmpeg_runs(ffmpeg_path):
         print("FFmpeg not found locally. Downloading...")
         os.makedirs(ffmpeg_folder, exist_ok=True)
-        resp = requests.get(FF_URL, stream=True)
+        import requests  # Only needed for this one-time download
+        resp = requests.get(FF_URL, stream=True, timeout=30)
         resp.raise_for_status()
-        zip_data = BytesIO(resp.content)
-        with zipfile.ZipFile(zip_data) as zf:
-            for member in zf.namelist():
-                low_member = member.lower().replace("\\", "/")
-                if "ffmpeg.exe" in low_member or "ffprobe.exe" in low_member:
-                    filename = os.path.basename(member)
-                    if not filename:
+        total = int(resp.headers.get("Content-Length", 0))
+        received = 0
+        tmp = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+        try:
+            # Spool the archive straight from the socket to disk, hashing it on the way
+            resp.raw.decode_content = True
+            digest = hashlib.sha256()
+            with tmp:
+                while True:
+                    chunk = resp.raw.read(1 << 20)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                    received += len(chunk)
+                    if progress:
+                        progress(received, total)
+            if digest.hexdigest() != FF_SHA256:
+                raise RuntimeError("Downloaded ffmpeg archive does not match the pinned SHA-256 checksum.")
+            with zipfile.ZipFile(tmp.name) as zf:
+                needed = {"ffmpeg.exe", "ffprobe.exe"}
+                for member in zf.infolist():
+                    filename = os.path.basename(member.filename.replace("\\", "/")).lower()
+                    if filename not in needed:
                         continue
                     target_path = os.path.join(ffmpeg_folder, filename)
-                    with open(target_path, "wb") as out_file:
-                        out_file.write(zf.read(member))
+                    with zf.open(member) as src, open(target_path, "wb") as out_file:
+                        shutil.copyfileobj(src, out_file, length=1 << 20)
+                    needed.discard(filename)
+                    if not needed:
+                        break
+            if needed:
+                raise RuntimeError("The ffmpeg archive is missing " + ", ".join(sorted(needed)))
+        finally:
+            os.remove(tmp.name)
         print("FFmpeg downloaded and extracted to:", ffmpeg_folder)
     return ffmpeg_path, ffprobe_path
 
-ffmpeg_exe, ffprobe_exe = ensure_ffmpeg_exists()
+class FfmpegSetupJobSignals(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, int)
+    done = QtCore.pyqtSignal(str, str)
+    failed = QtCore.pyqtSignal(str)
+
+class FfmpegSetupJob(QtCore.QRunnable):
+    """
+    Runs ensure_ffmpeg_exists on a QThreadPool worker, reporting download
+    progress and the resulting paths back on the GUI thread through signals.
+    """
+    def __init__(self):
+        super().__init__()
+        self.signals = FfmpegSetupJobSignals()
+
+    def run(self):
+        try:
+            paths = ensure_ffmpeg_exists(progress=self.signals.progress.emit)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(*paths)
+
+def setup_ffmpeg():
+    """
+    Runs FfmpegSetupJob behind a progress dialog, which only appears if the
+    check takes a while (i.e. on a fresh install, when ffmpeg is downloaded).
+    Returns (ffmpeg_exe, ffprobe_exe); raises RuntimeError if the setup failed.
+    """
+    dialog = QtWidgets.QProgressDialog("Checking FFmpeg...", None, 0, 0)
+    dialog.setWindowTitle("Multimedia Compressor")
+    dialog.setMinimumDuration(500)
+    result = {}
+    loop = QtCore.QEventLoop()
+
+    def onProgress(received, total):
+        dialog.setLabelText(f"Downloading FFmpeg (first run only): {received / (1024 * 1024):.1f} MB")
+        # A 0..0 range shows a busy indicator when the size is unknown
+        dialog.setMaximum(total)
+        dialog.setValue(min(received, total))
+
+    def onDone(ffmpeg_path, ffprobe_path):
+        result["paths"] = (ffmpeg_path, ffprobe_path)
+        loop.quit()
+
+    def onFailed(error):
+        result["error"] = error
+        loop.quit()
+
+    job = FfmpegSetupJob()
+    job.signals.progress.connect(onProgress)
+    job.signals.done.connect(onDone)
+    job.signals.failed.connect(onFailed)
+    QtCore.QThreadPool.globalInstance().start(job)
+    loop.exec_()
+    dialog.close()
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result["paths"]
+
+# Filled in by main() once setup_ffmpeg() has run
+ffmpeg_exe = ffprobe_exe = None
 
 # -------------------------------
 # Helper functions
 # -------------------------------
+@functools.lru_cache(maxsize=128)
+def _probe(filepath, mtime_ns, size):
+    """
+    Run ffprobe once per (path, mtime, size) and return its JSON format and stream info.
+    mtime_ns and size are only part of the cache key, so editing a file invalidates its entry.
+    """
+    cmd = [
+        ffprobe_exe, "-v", "error",
+        "-print_format", "json",
+        "-show_format", "-show_streams",
+        filepath
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            creationflags=SUBPROCESS_FLAGS)
+    return json.loads(result.stdout)
+
+def probe(filepath):
+    st = os.stat(filepath)
+    return _probe(filepath, st.st_mtime_ns, st.st_size)
+
+# -------------------------------
+# Container header parsing (duration without ffprobe / OpenCV)
+# -------------------------------
+def _find_mp4_atom(f, start, end, name):
+    """
+    Return (payload_start, atom_end) of the first atom called name between start and end.
+    """
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            size = end - pos
+        if size < header_size:
+            break
+        if kind == name:
+            return pos + header_size, pos + size
+        pos += size
+    return None
+
+def _duration_from_mp4(filepath):
+    """
+    Read the duration of an MP4/MOV file from its moov/mvhd atom.
+    """
+    with open(filepath, "rb") as f:
+        moov = _find_mp4_atom(f, 0, os.fstat(f.fileno()).st_size, b"moov")
+        if not moov:
+            return None
+        mvhd = _find_mp4_atom(f, moov[0], moov[1], b"mvhd")
+        if not mvhd:
+            return None
+        f.seek(mvhd[0])
+        version = f.read(4)[0]
+        if version == 1:
+            _, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+        else:
+            _, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+        return duration / timescale if timescale else None
+
+def _read_ebml_vint(f, keep_marker=False):
+    """
+    Read an EBML variable-length integer; element IDs keep their length marker bit.
+    Returns (value, length).
+    """
+    first = f.read(1)
+    if not first:
+        raise EOFError("Truncated EBML element")
+    length, mask = 1, 0x80
+    while length <= 8 and not first[0] & mask:
+        length += 1
+        mask >>= 1
+    if length > 8:
+        raise ValueError("Invalid EBML length marker")
+    value = first[0] if keep_marker else first[0] & (mask - 1)
+    for byte in f.read(length - 1):
+        value = (value << 8) | byte
+    return value, length
+
+def _ebml_children(f, start, end):
+    """
+    Yield (element_id, data_start, data_end) for each element between start and end.
+    """
+    pos = start
+    while pos < end:
+        f.seek(pos)
+        element_id, _ = _read_ebml_vint(f, keep_marker=True)
+        size, size_length = _read_ebml_vint(f)
+        data_start = f.tell()
+        # All-ones size means "unknown" (live-written files): runs to the end of the parent
+        data_end = end if size == (1 << (7 * size_length)) - 1 else min(end, data_start + size)
+        yield element_id, data_start, data_end
+        pos = data_end
+
+def _duration_from_mkv(filepath):
+    """
+    Read the duration of a Matroska/WebM file from Segment -> Info -> Duration.
+    """
+    with open(filepath, "rb") as f:
+        end = os.fstat(f.fileno()).st_size
+        segment = next((c for c in _ebml_children(f, 0, end) if c[0] == 0x18538067), None)
+        if not segment:
+            return None
+        info = next((c for c in _ebml_children(f, segment[1], segment[2]) if c[0] == 0x1549A966), None)
+        if not info:
+            return None
+        timecode_scale, duration = 1000000, None
+        for element_id, data_start, data_end in _ebml_children(f, info[1], info[2]):
+            f.seek(data_start)
+            data = f.read(data_end - data_start)
+            if element_id == 0x2AD7B1:
+                timecode_scale = int.from_bytes(data, "big")
+            elif element_id == 0x4489:
+                duration = struct.unpack(">f" if len(data) == 4 else ">d", data)[0]
+        if duration is None:
+            return None
+        return duration * timecode_scale / 1e9
+
+HEADER_DURATION_PARSERS = {
+    ".mp4": _duration_from_mp4,
+    ".m4v": _duration_from_mp4,
+    ".mov": _duration_from_mp4,
+    ".mkv": _duration_from_mkv,
+    ".webm": _duration_from_mkv,
+}
+
 def get_duration(filepath):
     """
-    Get video duration with ffprobe, fallback to OpenCV if available.
+    Get video duration from the MP4/MKV header, then OpenCV if available,
+    fallback to ffprobe.
     """
+    header_parser = HEADER_DURATION_PARSERS.get(os.path.splitext(filepath)[1].lower())
+    if header_parser:
+        try:
+            dur_val = header_parser(filepath)
+            if dur_val and dur_val > 0:
+                return dur_val
+        except Exception as e:
+            print("Reading duration from container header failed:", e)
+    cv2 = load_cv2()
+    if cv2:
+        try:
+            cap = cv2.VideoCapture(filepath)
+            if cap.isOpened():
+                fps = cap.get(cv2.CAP_PROP_FPS)
+                frames = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+                cap.release()
+                if fps > 0 and frames > 0:
+                    return frames / fps
+        except:
+            pass
     try:
-        cmd = [
-            ffprobe_exe, "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "format=duration",
-            "-of", "csv=p=0",
-            filepath
-        ]
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True)
-        dur_str = result.stdout.strip()
-        dur_val = float(dur_str)
+        dur_val = float(probe(filepath)["format"]["duration"])
         if dur_val <= 0:
             raise ValueError("Non-positive duration")
         return dur_val
     except Exception as e:
         print("ffprobe for video failed:", e)
-        if cv2:
-            try:
-                cap = cv2.VideoCapture(filepath)
-                if cap.isOpened():
-                    fps = cap.get(cv2.CAP_PROP_FPS)
-                    frames = cap.get(cv2.CAP_PROP_FRAME_COUNT)
-                    if fps > 0 and frames > 0:
-                        return frames / fps
-            except:
-                pass
         return None
 
 def get_audio_duration(filepath):
     """
-    Get audio duration with ffprobe, fallback to Mutagen if available.
+    Get audio duration with Mutagen if available, fallback to ffprobe.
     """
+    MutagenFile = load_mutagen_file()
+    if MutagenFile:
+        try:
+            audio = MutagenFile(filepath)
+            if audio and getattr(audio.info, 'length', 0) > 0:
+                return audio.info.length
+        except:
+            pass
     try:
-        cmd = [
-            ffprobe_exe, "-v", "error",
-            "-select_streams", "a:0",
-            "-show_entries", "format=duration",
-            "-of", "csv=p=0",
-            filepath
-        ]
-        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True)
-        dur_str = result.stdout.strip()
-        dur_val = float(dur_str)
+        info = probe(filepath)
+        audio_streams = [st for st in info.get("streams", [])
+                         if st.get("codec_type") == "audio" and "duration" in st]
+        dur_val = float(audio_streams[0]["duration"] if audio_streams else info["format"]["duration"])
         if dur_val <= 0:
             raise ValueError("Non-positive duration")
         return dur_val
     except Exception as e:
         print("ffprobe for audio failed:", e)
-        if MutagenFile:
-            try:
-                audio = MutagenFile(filepath)
-                if audio and hasattr(audio.info, 'length'):
-                    return audio.info.length
-            except:
-                pass
         return None
 
-def find_quality_for_target_size(img, target_size_bytes, min_quality=10, max_quality=95):
-    best_quality = None
-    best_diff = float('inf')
-    low = min_quality
-    high = max_quality
-    best_buffer = None
-    while low <= high:
+def video_dimensions(probe_json):
+    """
+    Width and height of the first video stream in ffprobe's JSON output, or None.
+    """
+    try:
+        for stream in json.loads(probe_json).get("streams", []):
+            if stream.get("codec_type") == "video":
+                return int(stream["width"]), int(stream["height"])
+    except Exception as e:
+        print("ffprobe for video size failed:", e)
+    return None
+
+SOFTWARE_VIDEO_CODECS = ("libx264", "libx265")
+
+# Hardware encoders offered in the Video tab once a test encode shows they work on this machine
+HARDWARE_VIDEO_ENCODERS = [
+    ("H.264 (NVIDIA NVENC)", "h264_nvenc"),
+    ("HEVC (NVIDIA NVENC)", "hevc_nvenc"),
+    ("H.264 (Intel Quick Sync)", "h264_qsv"),
+    ("HEVC (Intel Quick Sync)", "hevc_qsv"),
+    ("H.264 (AMD AMF)", "h264_amf"),
+    ("HEVC (AMD AMF)", "hevc_amf"),
+    ("H.264 (Apple VideoToolbox)", "h264_videotoolbox"),
+]
+
+def hardware_encoder_test_args(encoder):
+    """
+    ffmpeg arguments that encode a single blank frame with encoder and discard it.
+    """
+    return ["-hide_banner", "-v", "error", "-f", "lavfi", "-i", "nullsrc=s=256x256",
+            "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"]
+
+def two_pass_args(codec, pass_number):
+    """
+    ffmpeg arguments for one pass of a two-pass encode. The stats files are
+    written relative to the working directory, since x265-params can't take a
+    path containing a drive letter colon.
+    """
+    if codec == "libx265":
+        return ["-x265-params", f"pass={pass_number}:stats=x265_2pass.log"]
+    return ["-pass", str(pass_number), "-passlogfile", "ffmpeg2pass"]
+
+# ffmpeg argument templates, expanded with expand_template(). The video ones are
+# keyed by (mode, encoder family), see video_template_key().
+_SOFTWARE_VIDEO_ARGS = ["-c:v", "{codec}", "-b:v", "{bitrate}k", "-preset", "veryfast"]
+# veryfast only looks 10 frames ahead; 20 costs little and places bits better
+_X264_VIDEO_ARGS = _SOFTWARE_VIDEO_ARGS + ["-x264-params", "rc-lookahead=20"]
+_HARDWARE_VIDEO_ARGS = ["-c:v", "{codec}", "-b:v", "{bitrate}k", "-maxrate", "{maxrate}k"]
+VIDEO_CODEC_TEMPLATES = {
+    ("quality", "libx264"): _X264_VIDEO_ARGS,
+    ("target", "libx264"): _X264_VIDEO_ARGS,
+    ("quality", "libx265"): _SOFTWARE_VIDEO_ARGS,
+    ("target", "libx265"): _SOFTWARE_VIDEO_ARGS,
+    # Constant-quality VBR; a target size needs the bitrate to stay in charge
+    ("quality", "nvenc"): ["-c:v", "{codec}", "-b:v", "{bitrate}k", "-rc", "vbr", "-cq", "23", "-maxrate", "{maxrate}k"],
+    ("target", "nvenc"): ["-c:v", "{codec}", "-b:v", "{bitrate}k", "-rc", "vbr", "-maxrate", "{maxrate}k"],
+    ("quality", "hardware"): _HARDWARE_VIDEO_ARGS,
+    ("target", "hardware"): _HARDWARE_VIDEO_ARGS,
+}
+# 8-bit 4:2:0 is the only pixel format every browser and hardware decoder plays
+VIDEO_FILTER_TEMPLATE = ["-vf", "fps={fps},scale={width}:{height}:flags={scale_flags}",
+                         "-pix_fmt", "yuv420p", "-threads", "0"]
+VIDEO_AUDIO_TEMPLATES = {
+    "quality": ["-c:a", "copy"],
+    # Avoids the occasional muxer stall on high-fps inputs while audio is re-encoded
+    "target": ["-c:a", "aac", "-b:a", "128k", "-max_muxing_queue_size", "1024"],
+}
+AUDIO_CODEC_TEMPLATES = {
+    "aac": ["-c:a", "aac", "-strict", "experimental",
+            "-b:a", "{bitrate}k", "-ar", "{sample_rate}", "-ac", "{channels}"],
+    "libmp3lame": ["-c:a", "libmp3lame", "-b:a", "{bitrate}k", "-ar", "{sample_rate}", "-ac", "{channels}"],
+}
+
+def video_template_key(target_mode, codec):
+    if codec in SOFTWARE_VIDEO_CODECS:
+        family = codec
+    elif codec.endswith("_nvenc"):
+        family = "nvenc"
+    else:
+        family = "hardware"
+    return ("target" if target_mode else "quality", family)
+
+def expand_template(template, **values):
+    """
+    Fill in an argument template. Every entry stays its own argument, so values
+    never need shell quoting and no argument is ever dropped.
+    """
+    return [part.format_map(values) for part in template]
+
+def fast_downscale(img, size):
+    """
+    Resize img to size. Large downscales first go through Image.reduce(), an
+    integer box filter, so the LANCZOS pass only handles the final step.
+    """
+    factor = min(img.width // size[0], img.height // size[1])
+    # reduce() rejects palette, bilevel and 16-bit images; resize() alone handles those as before
+    if factor >= 2 and img.mode not in ("1", "P") and not img.mode.startswith("I;16"):
+        img = img.reduce(factor)
+    return img.resize(size, LANCZOS)
+
+def resize_image(img, size):
+    """
+    Resize a freshly opened img to size. JPEGs are decoded at 1/2, 1/4 or 1/8
+    scale by libjpeg first, keeping 2x headroom for the final resize.
+    """
+    if img.format == "JPEG":
+        img.draft("RGB", (size[0] * 2, size[1] * 2))
+    return fast_downscale(img, size)
+
+def check_jpeg_codec():
+    """
+    Warn if Pillow was built against plain libjpeg instead of libjpeg-turbo,
+    which makes every JPEG encode/decode several times slower.
+    """
+    from PIL import features
+    if features.check_feature("libjpeg_turbo") is False:
+        show_error_dialog("Warning",
+                          "Pillow was built without libjpeg-turbo, so JPEG compression will be slow.\n"
+                          "Reinstall Pillow (or Pillow-SIMD) built against libjpeg-turbo for faster encodes.")
+
+def jpeg_scale_factor(quality):
+    """
+    libjpeg's quantization table scaling factor (in percent) for a quality setting.
+    """
+    return 5000.0 / quality if quality < 50 else 200.0 - 2 * quality
+
+def quality_for_scale_factor(scale):
+    """
+    Inverse of jpeg_scale_factor.
+    """
+    return 5000.0 / scale if scale > 100 else (200.0 - scale) / 2
+
+# SSIM probes run on a thumbnail no larger than this, which is ~30x cheaper than the full image
+SSIM_PROBE_SIZE = (400, 400)
+# Encodes scoring at least this SSIM against the source are treated as visually lossless
+SSIM_GOAL = 0.98
+# The perceptual cap never goes below this; noisy photos can score well at qualities that visibly block
+PERCEPTUAL_MIN_QUALITY = 60
+
+def get_ssim_at_quality(photo, quality):
+    """
+    SSIM between photo and its own JPEG encode at quality.
+    """
+    buffer = BytesIO()
+    photo.save(buffer, "JPEG", quality=quality, progressive=True)
+    buffer.seek(0)
+    ssim_numba = load_ssim_numba()
+    if ssim_numba:
+        import numpy as np
+        return ssim_numba.compute_ssim(np.asarray(photo.convert("L")), np.asarray(Image.open(buffer).convert("L")))
+    return load_compute_ssim()(photo, Image.open(buffer))
+
+def find_perceptual_quality(img, min_quality=PERCEPTUAL_MIN_QUALITY, max_quality=95):
+    """
+    Bisect on a small probe of img for the lowest quality whose SSIM reaches
+    SSIM_GOAL. Returns None if neither numba nor pyssim is installed.
+    """
+    if load_ssim_numba() is None and load_compute_ssim() is None:
+        return None
+    scale = min(1.0, SSIM_PROBE_SIZE[0] / img.width, SSIM_PROBE_SIZE[1] / img.height)
+    probe = fast_downscale(img, (max(1, round(img.width * scale)), max(1, round(img.height * scale))))
+    low, high = min_quality, max_quality
+    while low < high:
         mid = (low + high) // 2
-        buffer = BytesIO()
-        img.save(buffer, "JPEG", quality=mid)
-        size = buffer.tell()
-        diff = abs(size - target_size_bytes)
-        if diff < best_diff:
-            best_diff = diff
-            best_quality = mid
-            best_buffer = buffer.getvalue()
-        if size > target_size_bytes:
-            high = mid - 1
+        if get_ssim_at_quality(probe, mid) >= SSIM_GOAL:
+            high = mid
         else:
             low = mid + 1
-    return best_quality, best_buffer
+    return low
+
+def find_quality_for_target_size(img, target_size_bytes, min_quality=10, max_quality=95,
+                                 perceptual_cap=False):
+    """
+    With perceptual_cap (and numba or pyssim installed), the search never goes
+    above the visually lossless quality from find_perceptual_quality, so a
+    generous target doesn't spend bytes on detail nobody can see.
+    The size search encodes once at quality 75 and uses libjpeg's quality ->
+    scaling factor curve (file size is roughly proportional to 1 / scale) to
+    predict the quality that hits target_size_bytes. If the prediction is off by
+    more than 5%, it takes one secant step through the two measured points.
+    Probes are plain baseline encodes with either encoder, and the chosen probe
+    is returned as is, so its measured size is the size on disk.
+    Returns (quality, jpeg_bytes) for the encode closest to the target.
+    """
+    # Decode (and convert) once; every encode below reuses the same pixel buffer
+    img.load()
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    turbo_jpeg = load_turbo_jpeg() if img.mode == "RGB" else None
+    pixels = None
+    if turbo_jpeg:
+        import numpy as np
+        from turbojpeg import TJPF_RGB, TJSAMP_420
+        pixels = np.asarray(img)
+
+    def encode(quality, buffer):
+        # Overwrite in place rather than allocating a fresh multi-megabyte buffer per probe
+        buffer.seek(0)
+        if pixels is not None:
+            # Pillow's default is 4:2:0 too, so both encoders hit the same sizes
+            buffer.write(turbo_jpeg.encode(pixels, quality=quality, pixel_format=TJPF_RGB,
+                                           jpeg_subsample=TJSAMP_420))
+        else:
+            # Plain baseline encodes, like TurboJPEG's: Huffman optimization would add a second
+            # pass to every probe, and the kept probe is the file that gets written
+            img.save(buffer, "JPEG", quality=quality, optimize=False, progressive=False)
+        buffer.truncate()
+        return buffer.tell()
+
+    best_buffer, scratch_buffer = BytesIO(), BytesIO()
+
+    if perceptual_cap:
+        perceptual_quality = find_perceptual_quality(img, max(min_quality, PERCEPTUAL_MIN_QUALITY), max_quality)
+        if perceptual_quality is not None:
+            # Only an upper bound: below it the target size alone decides
+            max_quality = perceptual_quality
+
+    def clamp(quality):
+        return max(min_quality, min(max_quality, int(round(quality))))
+
+    base_quality = clamp(75)
+    base_size = encode(base_quality, best_buffer)
+    best_quality = base_quality
+
+    def measure(quality):
+        nonlocal best_quality, best_buffer, scratch_buffer
+        size = encode(quality, scratch_buffer)
+        if abs(size - target_size_bytes) < abs(best_buffer.tell() - target_size_bytes):
+            best_quality = quality
+            best_buffer, scratch_buffer = scratch_buffer, best_buffer
+        return size
+
+    predicted_scale = jpeg_scale_factor(base_quality) * base_size / target_size_bytes
+    predicted_q = clamp(quality_for_scale_factor(predicted_scale))
+    if predicted_q != base_quality:
+        size = measure(predicted_q)
+        if abs(size - target_size_bytes) > 0.05 * target_size_bytes and size != base_size:
+            # Size is close to linear in 1 / scale, so interpolate there
+            x0 = 1.0 / jpeg_scale_factor(base_quality)
+            x1 = 1.0 / jpeg_scale_factor(predicted_q)
+            x = x1 + (target_size_bytes - size) * (x1 - x0) / (size - base_size)
+            if x > 0:
+                refined_q = clamp(quality_for_scale_factor(1.0 / x))
+                if refined_q not in (base_quality, predicted_q):
+                    measure(refined_q)
+
+    return best_quality, best_buffer.getvalue()
+
+# Large writes keep saving to network drives and spinning disks from crawling
+OUTPUT_BUFFER_SIZE = 2 * 1024 * 1024
+
+# libjpeg's standard luminance quantization table (the quality 50 baseline)
+STD_LUMINANCE_QUANT_TABLE = [
+    16, 11, 10, 16, 24, 40, 51, 61,
+    12, 12, 14, 19, 26, 58, 60, 55,
+    14, 13, 16, 24, 40, 57, 69, 56,
+    14, 17, 22, 29, 51, 87, 80, 62,
+    18, 22, 37, 56, 68, 109, 103, 77,
+    24, 35, 55, 64, 81, 104, 113, 92,
+    49, 64, 78, 87, 103, 121, 120, 101,
+    72, 92, 95, 98, 112, 100, 103, 99,
+]
+
+def estimate_jpeg_quality(img):
+    """
+    Estimate the quality a JPEG was saved with by comparing its luminance
+    quantization table against libjpeg's standard table.
+    Returns None if the image carries no quantization tables.
+    """
+    tables = getattr(img, "quantization", None)
+    if not tables or 0 not in tables:
+        return None
+    scale = 100.0 * sum(tables[0]) / sum(STD_LUMINANCE_QUANT_TABLE)
+    return max(1, min(100, int(round(quality_for_scale_factor(scale)))))
+
+# -------------------------------
+# Background image encoding
+# -------------------------------
+class TargetSizeJobSignals(QtCore.QObject):
+    # Queued across threads, so stick to types Qt already has registered:
+    # int for the quality, PyQt_PyObject for the encoded bytes
+    done = QtCore.pyqtSignal(int, object)
+    failed = QtCore.pyqtSignal(str)
+
+class TargetSizeJob(QtCore.QRunnable):
+    """
+    Resizes img to resize_to (if given) and runs find_quality_for_target_size on
+    a QThreadPool worker. Results are delivered back on the GUI thread through
+    signals.done(quality, jpeg_bytes).
+    """
+    def __init__(self, img, target_size_bytes, perceptual_cap=False, resize_to=None):
+        super().__init__()
+        self.img = img
+        self.target_size_bytes = target_size_bytes
+        self.perceptual_cap = perceptual_cap
+        self.resize_to = resize_to
+        self.signals = TargetSizeJobSignals()
+
+    def run(self):
+        try:
+            img = resize_image(self.img, self.resize_to) if self.resize_to else self.img
+            quality, buffer = find_quality_for_target_size(img, self.target_size_bytes,
+                                                           perceptual_cap=self.perceptual_cap)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(quality, buffer)
+
+class ImageSaveJobSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str)
+
+class ImageSaveJob(QtCore.QRunnable):
+    """
+    Decodes img, resizes it to resize_to (if given) and writes it to save_path
+    as PNG or JPEG on a QThreadPool worker, reporting back through
+    signals.done() or signals.failed(error).
+    """
+    def __init__(self, img, save_path, image_format, quality, resize_to=None):
+        super().__init__()
+        self.img = img
+        self.save_path = save_path
+        self.image_format = image_format
+        self.quality = quality
+        self.resize_to = resize_to
+        self.signals = ImageSaveJobSignals()
+
+    def run(self):
+        try:
+            # Decode before opening the output, in case it overwrites the source
+            img = resize_image(self.img, self.resize_to) if self.resize_to else self.img
+            img.load()
+            with open(self.save_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+                if self.image_format == "PNG":
+                    img.save(f, "PNG", optimize=True)
+                else:
+                    img.convert("RGB").save(f, "JPEG", quality=self.quality)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit()
+
+# -------------------------------
+# Background ffmpeg runner
+# -------------------------------
+class FFmpegRunner(QtCore.QObject):
+    """
+    Runs one or more ffmpeg commands back to back through QProcess so the GUI
+    stays responsive. Progress is parsed from ffmpeg's "-progress pipe:1"
+    output, with each command getting an equal share of the bar (0-50% and
+    50-100% for a two-pass encode), and only the tail of stderr is kept for
+    error reporting.
+    """
+    progress = QtCore.pyqtSignal(int)
+    finished = QtCore.pyqtSignal(bool, str)
+
+    def __init__(self, commands, duration=None, workdir=None, parent=None):
+        super().__init__(parent)
+        self.commands = list(commands)
+        self.commandCount = len(self.commands)
+        self.commandIndex = -1
+        self.duration = duration
+        self.workdir = workdir
+        self.proc = None
+        self.cancelled = False
+        self.pendingOutput = ""
+        self.stderrTail = collections.deque(maxlen=40)
+
+    def start(self):
+        command = self.commands.pop(0)
+        self.commandIndex += 1
+        self.pendingOutput = ""
+        self.proc = QtCore.QProcess(self)
+        if self.workdir:
+            self.proc.setWorkingDirectory(self.workdir)
+        self.proc.setProgram(command[0])
+        self.proc.setArguments(["-progress", "pipe:1", "-nostats"] + command[1:])
+        self.proc.readyReadStandardOutput.connect(self.onProgressOutput)
+        self.proc.readyReadStandardError.connect(self.onErrorOutput)
+        self.proc.errorOccurred.connect(self.onProcessError)
+        self.proc.finished.connect(self.onProcessFinished)
+        self.proc.start()
+
+    def cancel(self):
+        self.cancelled = True
+        self.commands = []
+        if self.proc is not None:
+            self.proc.kill()
+
+    def onProgressOutput(self):
+        self.pendingOutput += bytes(self.proc.readAllStandardOutput()).decode(errors="replace")
+        *lines, self.pendingOutput = self.pendingOutput.split("\n")
+        for line in lines:
+            key, _, value = line.strip().partition("=")
+            if key == "out_time_us" and self.duration:
+                try:
+                    seconds = int(value) / 1000000
+                except ValueError:
+                    continue
+                fraction = max(0.0, min(1.0, seconds / self.duration))
+                self.progress.emit(int(100 * (self.commandIndex + fraction) / self.commandCount))
+
+    def onErrorOutput(self):
+        text = bytes(self.proc.readAllStandardError()).decode(errors="replace")
+        self.stderrTail.extend(text.splitlines())
+
+    def onProcessError(self, error):
+        # finished() is never emitted when the process could not be started
+        if error == QtCore.QProcess.FailedToStart:
+            self.finished.emit(False, self.proc.errorString())
+
+    def onProcessFinished(self, exitCode, exitStatus):
+        if self.cancelled:
+            self.finished.emit(False, "Cancelled by user.")
+        elif exitStatus != QtCore.QProcess.NormalExit or exitCode != 0:
+            self.finished.emit(False, "\n".join(self.stderrTail))
+        elif self.commands:
+            self.start()
+        else:
+            self.progress.emit(100)
+            self.finished.emit(True, "")
+
+class HardwareEncoderProbe(QtCore.QObject):
+    """
+    Tries each of HARDWARE_VIDEO_ENCODERS with a 1-frame test encode through
+    QProcess, one after another. "ffmpeg -encoders" only lists what was compiled
+    in, and the Windows builds include NVENC, QSV and AMF whether or not the
+    GPU and driver are there. Emits found(label, encoder) for each encoder that
+    works, then finished().
+    """
+    found = QtCore.pyqtSignal(str, str)
+    finished = QtCore.pyqtSignal()
+
+    # A missing driver fails right away, but don't let a wedged one hold up the rest
+    TIMEOUT_MS = 10000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.candidates = list(HARDWARE_VIDEO_ENCODERS)
+        self.current = None
+        self.proc = None
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.onTimeout)
+
+    def start(self):
+        if not self.candidates:
+            self.finished.emit()
+            return
+        self.current = self.candidates.pop(0)
+        self.proc = QtCore.QProcess(self)
+        self.proc.setProgram(ffmpeg_exe)
+        self.proc.setArguments(hardware_encoder_test_args(self.current[1]))
+        self.proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        self.proc.errorOccurred.connect(self.onProcessError)
+        self.proc.finished.connect(self.onProcessFinished)
+        self.timer.start(self.TIMEOUT_MS)
+        self.proc.start()
+
+    def onTimeout(self):
+        print(f"{self.current[1]} test encode timed out")
+        self.proc.kill()
+
+    def onProcessError(self, error):
+        # finished() is never emitted when the process could not be started
+        if error == QtCore.QProcess.FailedToStart:
+            print("ffmpeg encoder probe failed:", self.proc.errorString())
+            self.timer.stop()
+            self.candidates = []
+            self.finished.emit()
+
+    def onProcessFinished(self, exitCode, exitStatus):
+        self.timer.stop()
+        if exitStatus == QtCore.QProcess.NormalExit and exitCode == 0:
+            self.found.emit(*self.current)
+        self.proc.deleteLater()
+        self.start()
 
 # -------------------------------
 # Modern Style Sheet
@@ -193,6 +930,31 @@ QLineEdit, QSpinBox, QDoubleSpinBox {
     border-radius: 4px;
     padding: 4px;
 }
+QCheckBox {
+    spacing: 6px;
+}
+QPushButton#linktreeBtn {
+    background-color: #ffffff;
+    color: #333333;
+    border: none;
+    border-radius: 8px;
+    padding: 12px;
+    font-size: 14pt;
+}
+QPushButton#linktreeBtn:hover {
+    background-color: #dddddd;
+}
+QLabel#creditsName {
+    font-weight: bold;
+    font-size: 16pt;
+    color: white;
+}
+QLabel#creditsAbout {
+    color: white;
+}
+"""
+
+tabStyle = """
 QTabWidget::pane {
     border: 1px solid #5e0080;
 }
@@ -208,18 +970,20 @@ QTabBar::tab {
 QTabBar::tab:selected {
     background: #5e0080;
 }
-QCheckBox {
-    spacing: 6px;
-}
 """
 
 #############################
 # ImageCompressorTab
 #############################
 class ImageCompressorTab(QtWidgets.QWidget):
-    def __init__(self):
+    def __init__(self, pool=None):
         super().__init__()
+        self.pool = pool or QtCore.QThreadPool.globalInstance()
         self.imagePath = ""
+        self.lastPreview = None
+        self.encodeJob = None
+        self.jpegtranProc = None
+        self.pendingSavePath = ""
         self.initUI()
 
     def initUI(self):
@@ -273,9 +1037,13 @@ class ImageCompressorTab(QtWidgets.QWidget):
         targetLayout.addWidget(self.targetSizeSpin)
         layout.addLayout(targetLayout)
 
-        compressBtn = QtWidgets.QPushButton("Compress Image")
-        compressBtn.clicked.connect(self.compressImage)
-        layout.addWidget(compressBtn)
+        self.perceptualCapCheck = QtWidgets.QCheckBox("Stop at visually lossless quality (smallest acceptable file)")
+        self.perceptualCapCheck.setToolTip("Needs numba or pyssim installed; otherwise only the target size is used.")
+        layout.addWidget(self.perceptualCapCheck)
+
+        self.compressBtn = QtWidgets.QPushButton("Compress Image")
+        self.compressBtn.clicked.connect(self.compressImage)
+        layout.addWidget(self.compressBtn)
 
         btnLayout = QtWidgets.QHBoxLayout()
         resetBtn = QtWidgets.QPushButton("Reset")
@@ -300,6 +1068,7 @@ class ImageCompressorTab(QtWidgets.QWidget):
         self.heightSpin.setValue(600)
         self.useTargetSizeCheck.setChecked(False)
         self.targetSizeSpin.setValue(1.0)
+        self.perceptualCapCheck.setChecked(False)
 
     def showHelp(self):
         QtWidgets.QMessageBox.information(self, "Image Compressor Help",
@@ -321,23 +1090,69 @@ class ImageCompressorTab(QtWidgets.QWidget):
         previewDialog.setWindowTitle("Image Preview")
         layout = QtWidgets.QVBoxLayout(previewDialog)
         label = QtWidgets.QLabel()
-        pixmap = QtGui.QPixmap(self.imagePath)
-        scaled_pixmap = pixmap.scaled(800, 600, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        try:
+            mtime = os.stat(self.imagePath).st_mtime_ns
+        except OSError as e:
+            show_error_dialog("Error", f"Failed to preview image.\nError: {str(e)}")
+            return
+        # Reopening the preview is instant: first this tab's last preview, then Qt's shared cache
+        if self.lastPreview and self.lastPreview[:2] == (self.imagePath, mtime):
+            scaled_pixmap = self.lastPreview[2]
+        else:
+            key = f"thumb:{self.imagePath}:{mtime}:800x600"
+            scaled_pixmap = QtGui.QPixmapCache.find(key)
+            if scaled_pixmap is None:
+                try:
+                    scaled_pixmap = self.previewPixmap(800, 600)
+                except Exception as e:
+                    show_error_dialog("Error", f"Failed to preview image.\nError: {str(e)}")
+                    return
+                QtGui.QPixmapCache.insert(key, scaled_pixmap)
+            self.lastPreview = (self.imagePath, mtime, scaled_pixmap)
         label.setPixmap(scaled_pixmap)
         layout.addWidget(label)
         previewDialog.exec_()
 
+    def previewPixmap(self, max_width, max_height):
+        # Decode straight to the preview size (libjpeg scales during IDCT) instead of
+        # decoding at full resolution and smooth-scaling afterwards
+        reader = QtGui.QImageReader(self.imagePath)
+        # Honour EXIF orientation; the scaled size applies before the rotation
+        reader.setAutoTransform(True)
+        size = reader.size()
+        image = QtGui.QImage()
+        if size.isValid():
+            if reader.transformation() & QtGui.QImageIOHandler.TransformationRotate90:
+                max_width, max_height = max_height, max_width
+            size.scale(max_width, max_height, QtCore.Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+            image = reader.read()
+        if not image.isNull():
+            return QtGui.QPixmap.fromImage(image)
+        # Qt has no reader for this file, so let Pillow decode it
+        return self.pillowPreviewPixmap(max_width, max_height)
+
+    def pillowPreviewPixmap(self, max_width, max_height):
+        img = Image.open(self.imagePath)
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):
+            # EXIF orientations that turn the image on its side
+            max_width, max_height = max_height, max_width
+        img.draft("RGB", (max_width, max_height))
+        scale = min(max_width / img.width, max_height / img.height)
+        size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+        img = ImageOps.exif_transpose(fast_downscale(img, size)).convert("RGBA")
+        data = img.tobytes("raw", "RGBA")
+        image = QtGui.QImage(data, img.width, img.height, 4 * img.width, QtGui.QImage.Format_RGBA8888)
+        return QtGui.QPixmap.fromImage(image)
+
     def compressImage(self):
         if not self.imagePath:
             QtWidgets.QMessageBox.warning(self, "Warning", "Please select an image file first.")
             return
         try:
+            # Only the header is read here; decoding and resizing happen in the pool jobs
             img = Image.open(self.imagePath)
-            if self.resizeCheck.isChecked():
-                img = img.resize(
-                    (self.widthSpin.value(), self.heightSpin.value()),
-                    Image.ANTIALIAS
-                )
+            resize_to = (self.widthSpin.value(), self.heightSpin.value()) if self.resizeCheck.isChecked() else None
             savePath, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, "Save Compressed Image", "",
                 "JPEG Files (*.jpg);;PNG Files (*.png);;All Files (*)")
@@ -347,29 +1162,95 @@ class ImageCompressorTab(QtWidgets.QWidget):
             ext = os.path.splitext(savePath)[1].lower()
             if self.useTargetSizeCheck.isChecked() and ext in [".jpg", ".jpeg"]:
                 target_size_bytes = self.targetSizeSpin.value() * 1024 * 1024
-                quality, buffer = find_quality_for_target_size(img, target_size_bytes)
-                if quality is not None:
-                    with open(savePath, "wb") as f:
-                        f.write(buffer)
-                    QtWidgets.QMessageBox.information(self, "Success",
-                        f"Image compressed using quality={quality}!")
-                else:
-                    show_error_dialog("Warning", "Could not determine an optimal quality setting.")
+                # The quality search encodes the full image several times, so keep it off the GUI thread
+                self.pendingSavePath = savePath
+                self.encodeJob = TargetSizeJob(img, target_size_bytes, self.perceptualCapCheck.isChecked(),
+                                               resize_to)
+                self.encodeJob.signals.done.connect(self.onTargetSizeDone)
+                self.encodeJob.signals.failed.connect(self.onEncodeFailed)
+                self.compressBtn.setEnabled(False)
+                self.pool.start(self.encodeJob)
             else:
                 quality = self.qualitySpin.value()
-                if ext in [".jpg", ".jpeg"]:
-                    img = img.convert("RGB")
-                    img.save(savePath, "JPEG", quality=quality)
-                elif ext == ".png":
-                    img.save(savePath, "PNG", optimize=True)
-                else:
-                    img = img.convert("RGB")
-                    img.save(savePath, "JPEG", quality=quality)
-                QtWidgets.QMessageBox.information(self, "Success",
-                    "Image compressed successfully!")
+                source_quality = estimate_jpeg_quality(img) if img.format == "JPEG" else None
+                # Decoding and encoding a large image takes long enough to stall the GUI
+                self.encodeJob = ImageSaveJob(img, savePath, "PNG" if ext == ".png" else "JPEG", quality,
+                                         resize_to)
+                self.encodeJob.signals.done.connect(self.onImageSaved)
+                self.encodeJob.signals.failed.connect(self.onEncodeFailed)
+                self.compressBtn.setEnabled(False)
+                if (ext in [".jpg", ".jpeg"] and resize_to is None
+                        and source_quality is not None and quality >= source_quality
+                        and self.optimizeJpegLosslessly(savePath, source_quality)):
+                    return
+                self.pool.start(self.encodeJob)
         except Exception as e:
             show_error_dialog("Error", f"Failed to compress image.\nError: {str(e)}")
 
+    def onTargetSizeDone(self, quality, buffer):
+        self.encodeJob = None
+        self.compressBtn.setEnabled(True)
+        try:
+            with open(self.pendingSavePath, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(buffer)
+        except Exception as e:
+            show_error_dialog("Error", f"Failed to compress image.\nError: {str(e)}")
+            return
+        QtWidgets.QMessageBox.information(self, "Success",
+            f"Image compressed using quality={quality}!")
+
+    def onImageSaved(self):
+        self.encodeJob = None
+        self.compressBtn.setEnabled(True)
+        QtWidgets.QMessageBox.information(self, "Success",
+            "Image compressed successfully!")
+
+    def onEncodeFailed(self, error_text):
+        self.encodeJob = None
+        self.compressBtn.setEnabled(True)
+        show_error_dialog("Error", f"Failed to compress image.\nError: {error_text}")
+
+    def optimizeJpegLosslessly(self, savePath, source_quality):
+        """
+        Rewrite the source JPEG with jpegtran (optimized Huffman tables, progressive)
+        without decoding any pixels, through QProcess so large files don't stall the
+        GUI. Returns False if jpegtran is unavailable; if it fails later, the pending
+        encodeJob runs instead as a normal re-encode.
+        """
+        if not jpegtran_exe or os.path.abspath(savePath) == os.path.abspath(self.imagePath):
+            return False
+        self.jpegtranProc = QtCore.QProcess(self)
+        self.jpegtranProc.setProgram(jpegtran_exe)
+        self.jpegtranProc.setArguments(
+            ["-optimize", "-progressive", "-copy", "none", "-outfile", savePath, self.imagePath])
+        self.jpegtranProc.errorOccurred.connect(self.onJpegtranError)
+        self.jpegtranProc.finished.connect(
+            lambda exitCode, exitStatus: self.onJpegtranFinished(exitCode, exitStatus, source_quality))
+        self.jpegtranProc.start()
+        return True
+
+    def onJpegtranError(self, error):
+        # finished() is never emitted when the process could not be started
+        if error == QtCore.QProcess.FailedToStart:
+            print("jpegtran failed:", self.jpegtranProc.errorString())
+            self.jpegtranProc.deleteLater()
+            self.jpegtranProc = None
+            self.pool.start(self.encodeJob)
+
+    def onJpegtranFinished(self, exitCode, exitStatus, source_quality):
+        stderr = bytes(self.jpegtranProc.readAllStandardError()).decode(errors="replace")
+        self.jpegtranProc.deleteLater()
+        self.jpegtranProc = None
+        if exitStatus != QtCore.QProcess.NormalExit or exitCode != 0:
+            print("jpegtran failed:", stderr)
+            self.pool.start(self.encodeJob)
+            return
+        self.encodeJob = None
+        self.compressBtn.setEnabled(True)
+        QtWidgets.QMessageBox.information(self, "Success",
+            f"Source is already JPEG quality ~{source_quality}, so it was optimized "
+            "losslessly instead of being re-encoded.")
+
 #############################
 # VideoCompressorTab
 #############################
@@ -377,6 +1258,11 @@ class VideoCompressorTab(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
         self.videoPath = ""
+        self.videoSize = None
+        self.sizeProbe = None
+        self.previewProc = None
+        self.runner = None
+        self.passlogDir = None
         self.initUI()
 
     def initUI(self):
@@ -431,6 +1317,10 @@ class VideoCompressorTab(QtWidgets.QWidget):
         self.codecCombo = QtWidgets.QComboBox()
         self.codecCombo.addItem("H.264 (libx264)", "libx264")
         self.codecCombo.addItem("HEVC (libx265)", "libx265")
+        # Hardware encoders are appended as their test encodes succeed, without blocking the tab
+        self.encoderProbe = HardwareEncoderProbe(self)
+        self.encoderProbe.found.connect(self.codecCombo.addItem)
+        self.encoderProbe.start()
         codecLayout.addWidget(codecLabel)
         codecLayout.addWidget(self.codecCombo)
         layout.addLayout(codecLayout)
@@ -447,9 +1337,19 @@ class VideoCompressorTab(QtWidgets.QWidget):
         targetLayout.addWidget(self.targetSizeSpin)
         layout.addLayout(targetLayout)
 
-        compressBtn = QtWidgets.QPushButton("Compress Video")
-        compressBtn.clicked.connect(self.compressVideo)
-        layout.addWidget(compressBtn)
+        self.compressBtn = QtWidgets.QPushButton("Compress Video")
+        self.compressBtn.clicked.connect(self.compressVideo)
+        layout.addWidget(self.compressBtn)
+
+        progressLayout = QtWidgets.QHBoxLayout()
+        self.progressBar = QtWidgets.QProgressBar()
+        self.progressBar.setRange(0, 100)
+        self.cancelBtn = QtWidgets.QPushButton("Cancel")
+        self.cancelBtn.setEnabled(False)
+        self.cancelBtn.clicked.connect(self.cancelCompression)
+        progressLayout.addWidget(self.progressBar)
+        progressLayout.addWidget(self.cancelBtn)
+        layout.addLayout(progressLayout)
 
         btnLayout = QtWidgets.QHBoxLayout()
         resetBtn = QtWidgets.QPushButton("Reset")
@@ -468,6 +1368,7 @@ class VideoCompressorTab(QtWidgets.QWidget):
     def resetFields(self):
         self.fileLabel.setText("No video selected")
         self.videoPath = ""
+        self.videoSize = None
         self.bitrateSpin.setValue(1000)
         self.videoWidthSpin.setValue(640)
         self.videoHeightSpin.setValue(480)
@@ -475,6 +1376,7 @@ class VideoCompressorTab(QtWidgets.QWidget):
         self.codecCombo.setCurrentIndex(0)
         self.useTargetSizeCheck.setChecked(False)
         self.targetSizeSpin.setValue(10.0)
+        self.progressBar.setValue(0)
 
     def showHelp(self):
         QtWidgets.QMessageBox.information(self, "Video Compressor Help",
@@ -489,23 +1391,118 @@ class VideoCompressorTab(QtWidgets.QWidget):
         if fileName:
             self.videoPath = fileName
             self.fileLabel.setText(os.path.basename(fileName))
+            self.probeVideoSize()
+
+    def probeVideoSize(self):
+        """
+        Read the source dimensions with ffprobe through QProcess, so they're at hand
+        for picking scale flags without compressVideo blocking on a probe.
+        """
+        self.videoSize = None
+        if self.sizeProbe is not None:
+            self.sizeProbe.kill()
+        proc = self.sizeProbe = QtCore.QProcess(self)
+        path = self.videoPath
+        proc.finished.connect(lambda exitCode, exitStatus: self.onVideoSizeProbed(proc, path, exitCode))
+        proc.start(ffprobe_exe, ["-v", "error", "-select_streams", "v:0", "-show_entries",
+                                 "stream=codec_type,width,height", "-print_format", "json", path])
+
+    def onVideoSizeProbed(self, proc, path, exitCode):
+        proc.deleteLater()
+        if proc is self.sizeProbe:
+            self.sizeProbe = None
+        # A newer selection may have replaced this video while ffprobe ran
+        if path != self.videoPath:
+            return
+        if exitCode != 0:
+            print("ffprobe for video size failed:", bytes(proc.readAllStandardError()).decode(errors="replace"))
+            return
+        self.videoSize = video_dimensions(bytes(proc.readAllStandardOutput()).decode(errors="replace"))
 
     def previewVideo(self):
         if not self.videoPath:
             QtWidgets.QMessageBox.warning(self, "Warning", "Please select a video file first.")
             return
+        if self.previewProc is not None:
+            # Still cutting the clip for the previous click
+            return
+        self.makePreviewClip()
+
+    def makePreviewClip(self, seconds=10, timeout=15):
+        """
+        Stream-copy the first few seconds into a temp file through QProcess, so the
+        player only has to load a small clip and a slow drive doesn't stall the GUI.
+        showPreview runs once ffmpeg is done, with the original if it couldn't do it.
+        """
+        suffix = os.path.splitext(self.videoPath)[1] or ".mp4"
+        fd, preview_path = tempfile.mkstemp(prefix="compressor_preview_", suffix=suffix)
+        os.close(fd)
+        path = self.videoPath
+        proc = self.previewProc = QtCore.QProcess(self)
+        # Give up on the clip and play the original if ffmpeg hangs on the source
+        timer = QtCore.QTimer(proc)
+        timer.setSingleShot(True)
+        timer.timeout.connect(proc.kill)
+        timer.start(timeout * 1000)
+        proc.errorOccurred.connect(lambda error: self.onPreviewClipError(proc, path, preview_path, error))
+        proc.finished.connect(
+            lambda exitCode, exitStatus: self.onPreviewClipFinished(proc, path, preview_path, exitCode, exitStatus))
+        proc.start(ffmpeg_exe, ["-v", "error", "-y", "-ss", "0", "-t", str(seconds), "-i", path,
+                                "-c", "copy", preview_path])
+
+    def onPreviewClipError(self, proc, path, preview_path, error):
+        # finished() is never emitted when the process could not be started
+        if error == QtCore.QProcess.FailedToStart:
+            self.onPreviewClipDone(proc, path, preview_path, proc.errorString())
+
+    def onPreviewClipFinished(self, proc, path, preview_path, exitCode, exitStatus):
+        error = None
+        if exitStatus != QtCore.QProcess.NormalExit or exitCode != 0:
+            error = bytes(proc.readAllStandardError()).decode(errors="replace").strip() or "ffmpeg was stopped"
+        self.onPreviewClipDone(proc, path, preview_path, error)
+
+    def onPreviewClipDone(self, proc, path, preview_path, error):
+        proc.deleteLater()
+        self.previewProc = None
+        if error:
+            print("Preview clip failed:", error)
+            try:
+                os.unlink(preview_path)
+            except OSError:
+                pass
+            preview_path = None
+        self.showPreview(path, preview_path)
+
+    def showPreview(self, path, preview_path=None):
         dlg = QtWidgets.QDialog(self)
+        dlg.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         dlg.setWindowTitle("Video Preview")
         dlg.resize(800, 600)
         layout = QtWidgets.QVBoxLayout(dlg)
+        # QtMultimedia loads its media backends on import, so only pull it in for previews
+        from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+        from PyQt5.QtMultimediaWidgets import QVideoWidget
         videoWidget = QVideoWidget()
         layout.addWidget(videoWidget)
         player = QMediaPlayer(dlg)
         player.setVideoOutput(videoWidget)
-        url = QtCore.QUrl.fromLocalFile(self.videoPath)
+        url = QtCore.QUrl.fromLocalFile(preview_path or path)
         player.setMedia(QMediaContent(url))
         player.play()
-        dlg.exec_()
+        if preview_path:
+            dlg.finished.connect(lambda: self.removePreviewClip(player, preview_path))
+        # Window-modal without a nested event loop; this runs from a QProcess slot
+        dlg.open()
+
+    def removePreviewClip(self, player, preview_path):
+        from PyQt5.QtMultimedia import QMediaContent
+        # Release the file first, Windows won't delete it while the player holds it open
+        player.stop()
+        player.setMedia(QMediaContent())
+        try:
+            os.unlink(preview_path)
+        except OSError as e:
+            print("Could not remove preview clip:", e)
 
     def compressVideo(self):
         if not self.videoPath:
@@ -540,40 +1537,108 @@ class VideoCompressorTab(QtWidgets.QWidget):
             else:
                 bitrate = self.bitrateSpin.value()
 
-            command = [
-                ffmpeg_exe,
-                "-i", self.videoPath,
-                "-c:v", codec,
-                f"-b:v", f"{bitrate}k",
-                "-vf", f"scale={width}:{height}",
-                "-r", str(fps),
-                "-c:a", "aac" if self.useTargetSizeCheck.isChecked() else "copy",
-                ("-b:a", "128k") if self.useTargetSizeCheck.isChecked() else (),
-                savePath
-            ]
-            cmd_final = []
-            for part in command:
-                if isinstance(part, tuple):
-                    cmd_final.extend(part)
-                else:
-                    if part:
-                        cmd_final.append(part)
-
-            process = subprocess.run(cmd_final, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True)
-            if process.returncode == 0:
-                QtWidgets.QMessageBox.information(self, "Success", "Video compressed successfully!")
+            target_mode = self.useTargetSizeCheck.isChecked()
+            hardware = codec not in SOFTWARE_VIDEO_CODECS
+            # Probed when the file was selected; unknown until that probe finishes
+            source_size = self.videoSize
+            # An area (box) filter is the right kernel for 2x+ downscales, fast_bilinear otherwise
+            if source_size and width * 2 <= source_size[0] and height * 2 <= source_size[1]:
+                scale_flags = "area"
             else:
-                show_error_dialog("Error", f"Video compression failed.\nError: {process.stderr}")
+                scale_flags = "fast_bilinear"
+            video_args = expand_template(VIDEO_CODEC_TEMPLATES[video_template_key(target_mode, codec)],
+                                         codec=codec, bitrate=bitrate, maxrate=bitrate * 2)
+            video_args += expand_template(VIDEO_FILTER_TEMPLATE, fps=fps, width=width, height=height,
+                                          scale_flags=scale_flags)
+            output_args = list(VIDEO_AUDIO_TEMPLATES["target" if target_mode else "quality"])
+            if os.path.splitext(savePath)[1].lower() in (".mp4", ".m4v", ".mov"):
+                # Put the moov atom up front so the file can start playing before it's fully read
+                output_args += ["-movflags", "+faststart"]
+            # The save dialog already confirmed overwriting, so don't let ffmpeg prompt for it
+            base = [os.path.abspath(ffmpeg_exe), "-y", "-i", self.videoPath] + video_args
+
+            commands = [base + output_args + [savePath]]
+            workdir = None
+            if target_mode and not hardware:
+                # Two-pass ABR actually lands on the computed bitrate, single-pass often misses by 10-20%
+                self.passlogDir = workdir = tempfile.mkdtemp(prefix="compressor_passlog_")
+                commands = [
+                    base + two_pass_args(codec, 1) + ["-an", "-f", "null", os.devnull],
+                    base + two_pass_args(codec, 2) + output_args + [savePath],
+                ]
+            self.startRunner(commands, get_duration(self.videoPath), workdir)
         except Exception as e:
+            self.removePasslogDir()
             show_error_dialog("Error", f"Failed to compress video.\nError: {str(e)}")
 
+    def startRunner(self, commands, duration, workdir=None):
+        self.runner = FFmpegRunner(commands, duration, workdir, self)
+        self.runner.progress.connect(self.progressBar.setValue)
+        self.runner.finished.connect(self.onCompressFinished)
+        self.progressBar.setValue(0)
+        # Unknown duration: show a busy indicator instead of a percentage
+        self.progressBar.setRange(0, 100 if duration else 0)
+        self.compressBtn.setEnabled(False)
+        self.cancelBtn.setEnabled(True)
+        self.runner.start()
+
+    def cancelCompression(self):
+        if self.runner is not None:
+            self.runner.cancel()
+
+    def removePasslogDir(self):
+        if self.passlogDir:
+            shutil.rmtree(self.passlogDir, ignore_errors=True)
+            self.passlogDir = None
+
+    def onCompressFinished(self, ok, error_text):
+        self.runner.deleteLater()
+        self.runner = None
+        self.removePasslogDir()
+        self.progressBar.setRange(0, 100)
+        self.compressBtn.setEnabled(True)
+        self.cancelBtn.setEnabled(False)
+        if ok:
+            QtWidgets.QMessageBox.information(self, "Success", "Video compressed successfully!")
+        else:
+            self.progressBar.setValue(0)
+            show_error_dialog("Error", f"Video compression failed.\nError: {error_text}")
+
 #############################
 # AudioCompressorTab
 #############################
+class AudioDurationsJobSignals(QtCore.QObject):
+    # A list of floats (None where unknown), passed as PyQt_PyObject
+    done = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+
+class AudioDurationsJob(QtCore.QRunnable):
+    """
+    Runs get_audio_duration for every path on a QThreadPool worker; without
+    Mutagen that is one ffprobe per file. Results are delivered back on the GUI
+    thread through signals.done(durations).
+    """
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+        self.signals = AudioDurationsJobSignals()
+
+    def run(self):
+        try:
+            durations = [get_audio_duration(path) for path in self.paths]
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(durations)
+
 class AudioCompressorTab(QtWidgets.QWidget):
-    def __init__(self):
+    def __init__(self, pool=None):
         super().__init__()
+        self.pool = pool or QtCore.QThreadPool.globalInstance()
         self.audioPath = ""
+        self.batchPaths = []
+        self.durationsJob = None
+        self.runner = None
         self.initUI()
 
     def initUI(self):
@@ -584,10 +1649,13 @@ class AudioCompressorTab(QtWidgets.QWidget):
         self.fileLabel = QtWidgets.QLabel("No audio selected")
         selectBtn = QtWidgets.QPushButton("Select Audio")
         selectBtn.clicked.connect(self.selectAudio)
+        batchBtn = QtWidgets.QPushButton("Batch Select")
+        batchBtn.clicked.connect(self.selectAudioBatch)
         previewBtn = QtWidgets.QPushButton("Preview Audio")
         previewBtn.clicked.connect(self.previewAudio)
         fileLayout.addWidget(self.fileLabel)
         fileLayout.addWidget(selectBtn)
+        fileLayout.addWidget(batchBtn)
         fileLayout.addWidget(previewBtn)
         layout.addLayout(fileLayout)
 
@@ -645,9 +1713,20 @@ class AudioCompressorTab(QtWidgets.QWidget):
         layout.addLayout(targetLayout)
 
         # Compress button
-        compressBtn = QtWidgets.QPushButton("Compress Audio")
-        compressBtn.clicked.connect(self.compressAudio)
-        layout.addWidget(compressBtn)
+        self.compressBtn = QtWidgets.QPushButton("Compress Audio")
+        self.compressBtn.clicked.connect(self.compressAudio)
+        layout.addWidget(self.compressBtn)
+
+        # Progress and cancel
+        progressLayout = QtWidgets.QHBoxLayout()
+        self.progressBar = QtWidgets.QProgressBar()
+        self.progressBar.setRange(0, 100)
+        self.cancelBtn = QtWidgets.QPushButton("Cancel")
+        self.cancelBtn.setEnabled(False)
+        self.cancelBtn.clicked.connect(self.cancelCompression)
+        progressLayout.addWidget(self.progressBar)
+        progressLayout.addWidget(self.cancelBtn)
+        layout.addLayout(progressLayout)
 
         # Reset, Help, and Close buttons
         btnLayout = QtWidgets.QHBoxLayout()
@@ -667,17 +1746,20 @@ class AudioCompressorTab(QtWidgets.QWidget):
     def resetFields(self):
         self.fileLabel.setText("No audio selected")
         self.audioPath = ""
+        self.batchPaths = []
         self.bitrateSpin.setValue(128)
         self.sampleSpin.setValue(44100)
         self.channelCombo.setCurrentIndex(0)
         self.codecCombo.setCurrentIndex(0)
         self.useTargetSizeCheck.setChecked(False)
         self.targetSizeSpin.setValue(1.0)
+        self.progressBar.setValue(0)
 
     def showHelp(self):
         QtWidgets.QMessageBox.information(self, "Audio Compressor Help",
             "Select an audio file, set bitrate, sample rate, channels, and codec.\n"
-            "Optionally, enable target file size mode. Then click 'Compress Audio'.")
+            "Optionally, enable target file size mode. Then click 'Compress Audio'.\n"
+            "Use 'Batch Select' to compress several files at once into a folder of your choice.")
 
     def selectAudio(self):
         fileName, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -685,8 +1767,18 @@ class AudioCompressorTab(QtWidgets.QWidget):
             "Audio Files (*.mp3 *.wav *.aac *.flac *.ogg);;All Files (*)")
         if fileName:
             self.audioPath = fileName
+            self.batchPaths = []
             self.fileLabel.setText(os.path.basename(fileName))
 
+    def selectAudioBatch(self):
+        fileNames, _ = QtWidgets.QFileDialog.getOpenFileNames(
+            self, "Select Audio Files", "",
+            "Audio Files (*.mp3 *.wav *.aac *.flac *.ogg);;All Files (*)")
+        if fileNames:
+            self.batchPaths = fileNames
+            self.audioPath = fileNames[0]
+            self.fileLabel.setText(f"{len(fileNames)} files selected")
+
     def previewAudio(self):
         if not self.audioPath:
             QtWidgets.QMessageBox.warning(self, "Warning", "Please select an audio file first.")
@@ -696,6 +1788,7 @@ class AudioCompressorTab(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(dlg)
         label = QtWidgets.QLabel("Playing Audio. Close this window to stop.")
         layout.addWidget(label)
+        from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
         player = QMediaPlayer(dlg)
         url = QtCore.QUrl.fromLocalFile(self.audioPath)
         player.setMedia(QMediaContent(url))
@@ -707,6 +1800,9 @@ class AudioCompressorTab(QtWidgets.QWidget):
         if not self.audioPath:
             QtWidgets.QMessageBox.warning(self, "Warning", "Please select an audio file first.")
             return
+        if len(self.batchPaths) > 1:
+            self.compressAudioBatch()
+            return
         try:
             savePath, _ = QtWidgets.QFileDialog.getSaveFileName(
                 self, "Save Compressed Audio", "",
@@ -738,28 +1834,115 @@ class AudioCompressorTab(QtWidgets.QWidget):
             else:
                 bitrate = self.bitrateSpin.value()
 
-            sample_rate = self.sampleSpin.value()
-            channels = self.channelCombo.currentData()
+            # The save dialog already confirmed overwriting, so don't let ffmpeg prompt for it
+            command = [os.path.abspath(ffmpeg_exe), "-y", "-i", self.audioPath]
+            command.extend(self.audioOutputArgs(codec, bitrate) + [savePath])
+            self.startRunner([command], get_audio_duration(self.audioPath))
+        except Exception as e:
+            show_error_dialog("Error", f"Failed to compress audio.\nError: {str(e)}")
 
-            command = [ffmpeg_exe, "-i", self.audioPath]
-            if codec == "aac":
-                command.extend(["-c:a", codec, "-strict", "experimental"])
-            else:
-                command.extend(["-c:a", codec])
-            command.extend([
-                "-b:a", f"{bitrate}k",
-                "-ar", str(sample_rate),
-                "-ac", str(channels),
-                savePath
-            ])
-
-            proc = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            if proc.returncode == 0:
-                QtWidgets.QMessageBox.information(self, "Success", "Audio compressed successfully!")
-            else:
-                show_error_dialog("Error", f"Audio compression failed.\nError: {proc.stderr}")
+    def audioOutputArgs(self, codec, bitrate):
+        return expand_template(AUDIO_CODEC_TEMPLATES[codec], bitrate=bitrate,
+                               sample_rate=self.sampleSpin.value(), channels=self.channelCombo.currentData())
+
+    def compressAudioBatch(self):
+        """
+        Compress every file from Batch Select with a single ffmpeg process (one
+        -i per input, each mapped to its own output), so ffmpeg's startup cost is
+        paid once instead of once per file.
+        """
+        try:
+            outDir = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Output Folder")
+            if not outDir:
+                return
+            codec = self.codecCombo.currentData()
+            output_ext = ".m4a" if codec == "aac" else ".mp3"
+            paths = list(self.batchPaths)
+            outputs = []
+            for path in paths:
+                stem = os.path.splitext(os.path.basename(path))[0] + "_compressed"
+                out_path = os.path.join(outDir, stem + output_ext)
+                # Inputs like song.mp3 and song.flac would otherwise write the same output
+                counter = 2
+                while out_path in outputs:
+                    out_path = os.path.join(outDir, f"{stem}_{counter}{output_ext}")
+                    counter += 1
+                outputs.append(out_path)
+            existing = [path for path in outputs if os.path.exists(path)]
+            if existing and QtWidgets.QMessageBox.question(
+                    self, "Overwrite Files",
+                    f"{len(existing)} output file(s) already exist in that folder. Overwrite them?"
+                    ) != QtWidgets.QMessageBox.Yes:
+                return
+            target_size_mb = self.targetSizeSpin.value() if self.useTargetSizeCheck.isChecked() else None
+            bitrate = self.bitrateSpin.value()
         except Exception as e:
             show_error_dialog("Error", f"Failed to compress audio.\nError: {str(e)}")
+            return
+        # Durations can mean one ffprobe per file, so they're read on the pool, not the GUI thread
+        self.durationsJob = AudioDurationsJob(paths)
+        self.durationsJob.signals.done.connect(
+            lambda durations: self.onBatchDurations(paths, outputs, durations, codec, target_size_mb, bitrate))
+        self.durationsJob.signals.failed.connect(self.onBatchDurationsFailed)
+        self.compressBtn.setEnabled(False)
+        # Busy indicator until the durations are in and ffmpeg reports progress
+        self.progressBar.setRange(0, 0)
+        self.pool.start(self.durationsJob)
+
+    def onBatchDurations(self, paths, outputs, durations, codec, target_size_mb, bitrate):
+        self.durationsJob = None
+        self.compressBtn.setEnabled(True)
+        self.progressBar.setRange(0, 100)
+        try:
+            if target_size_mb and not all(durations):
+                show_error_dialog("Warning", "Could not determine the duration of every selected file.")
+                return
+            command = [os.path.abspath(ffmpeg_exe), "-y"]
+            for path in paths:
+                command += ["-i", path]
+            for index, (out_path, dur) in enumerate(zip(outputs, durations)):
+                if target_size_mb:
+                    out_bitrate = int((target_size_mb * 1024 * 1024 * 8 / dur) / 1000)
+                else:
+                    out_bitrate = bitrate
+                command += ["-map", f"{index}:a:0"] + self.audioOutputArgs(codec, out_bitrate) + [out_path]
+            # All outputs are encoded side by side, so the longest input sets the pace
+            self.startRunner([command], max(durations) if all(durations) else None)
+        except Exception as e:
+            show_error_dialog("Error", f"Failed to compress audio.\nError: {str(e)}")
+
+    def onBatchDurationsFailed(self, error_text):
+        self.durationsJob = None
+        self.compressBtn.setEnabled(True)
+        self.progressBar.setRange(0, 100)
+        show_error_dialog("Error", f"Failed to compress audio.\nError: {error_text}")
+
+    def startRunner(self, commands, duration):
+        self.runner = FFmpegRunner(commands, duration, parent=self)
+        self.runner.progress.connect(self.progressBar.setValue)
+        self.runner.finished.connect(self.onCompressFinished)
+        self.progressBar.setValue(0)
+        # Unknown duration: show a busy indicator instead of a percentage
+        self.progressBar.setRange(0, 100 if duration else 0)
+        self.compressBtn.setEnabled(False)
+        self.cancelBtn.setEnabled(True)
+        self.runner.start()
+
+    def cancelCompression(self):
+        if self.runner is not None:
+            self.runner.cancel()
+
+    def onCompressFinished(self, ok, error_text):
+        self.runner.deleteLater()
+        self.runner = None
+        self.progressBar.setRange(0, 100)
+        self.compressBtn.setEnabled(True)
+        self.cancelBtn.setEnabled(False)
+        if ok:
+            QtWidgets.QMessageBox.information(self, "Success", "Audio compressed successfully!")
+        else:
+            self.progressBar.setValue(0)
+            show_error_dialog("Error", f"Audio compression failed.\nError: {error_text}")
 
 #############################
 # Custom Linktree Widget & Credits
@@ -771,54 +1954,61 @@ class CustomLinktreeWidget(QtWidgets.QWidget):
         self.initUI()
     def initUI(self):
         layout = QtWidgets.QVBoxLayout(self)
-        for link in self.links:
+        # URLs are parsed once here rather than on every click, and every button shares one slot
+        urls = [QtCore.QUrl(link['url']) for link in self.links]
+        for link, url in zip(self.links, urls):
             btn = QtWidgets.QPushButton(link['text'])
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #ffffff;
-                    color: #333333;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 12px;
-                    font-size: 14pt;
-                }
-                QPushButton:hover {
-                    background-color: #dddddd;
-                }
-            """)
-            btn.clicked.connect(lambda checked, url=link['url']: QtGui.QDesktopServices.openUrl(QtCore.QUrl(url)))
+            btn.setObjectName("linktreeBtn")
+            btn.setProperty("linkUrl", url)
+            btn.clicked.connect(self.openLink)
             layout.addWidget(btn)
         layout.addStretch()
         self.setLayout(layout)
 
+    def openLink(self):
+        QtGui.QDesktopServices.openUrl(self.sender().property("linkUrl"))
+
+PROFILE_IMAGE_URL = "https://files.fivemerr.com/images/d2100fe4-fade-45c6-a481-aab71e862fd3.png"
+PROFILE_IMAGE_TIMEOUT_MS = 2000
+
+def profile_cache_path(url):
+    """
+    Where the scaled copy of the image at url is cached. Keyed by a hash of the
+    URL, so pointing PROFILE_IMAGE_URL at a new picture never shows the old one.
+    """
+    cache_dir = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation)
+    QtCore.QDir().mkpath(cache_dir)
+    return os.path.join(cache_dir, hashlib.md5(url.encode("utf-8")).hexdigest() + "_100.png")
+
+@functools.lru_cache(maxsize=None)
+def fallback_avatar():
+    """
+    Gray 100x100 placeholder shown until (or instead of) the profile picture,
+    built once per run.
+    """
+    pixmap = QtGui.QPixmap(100, 100)
+    pixmap.fill(QtGui.QColor("gray"))
+    return pixmap
+
 class CreditsTab(QtWidgets.QWidget):
-    def __init__(self):
+    def __init__(self, nam=None):
         super().__init__()
+        # Fetches run asynchronously on Qt's event loop, never blocking construction.
+        # Sharing the window's manager reuses its open connections and HTTP disk cache.
+        self.nam = nam or QtNetwork.QNetworkAccessManager(self)
         self.initUI()
     def initUI(self):
         layout = QtWidgets.QVBoxLayout()
         profileLayout = QtWidgets.QHBoxLayout()
-        profilePic = QtWidgets.QLabel()
-        image_url = "https://files.fivemerr.com/images/d2100fe4-fade-45c6-a481-aab71e862fd3.png"
-        try:
-            req = Request(image_url, headers={'User-Agent': 'Mozilla/5.0'})
-            data = urlopen(req).read()
-            pixmap = QtGui.QPixmap()
-            if not pixmap.loadFromData(data):
-                raise Exception("Failed to load image from data")
-        except Exception as e:
-            print("Image download failed:", e)
-            pixmap = QtGui.QPixmap(100, 100)
-            pixmap.fill(QtGui.QColor("gray"))
-        pixmap = pixmap.scaled(100, 100, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        profilePic.setPixmap(pixmap)
-        profilePic.setFixedSize(100, 100)
-        profileLayout.addWidget(profilePic)
+        self.profilePic = QtWidgets.QLabel()
+        self.profilePic.setFixedSize(100, 100)
+        self.loadProfilePixmap(PROFILE_IMAGE_URL, profile_cache_path(PROFILE_IMAGE_URL))
+        profileLayout.addWidget(self.profilePic)
         infoLayout = QtWidgets.QVBoxLayout()
         nameLabel = QtWidgets.QLabel("J_emmons_07")
-        nameLabel.setStyleSheet("font-weight: bold; font-size: 16pt; color: white;")
+        nameLabel.setObjectName("creditsName")
         aboutLabel = QtWidgets.QLabel("Just a random guy on the internet")
-        aboutLabel.setStyleSheet("color: white;")
+        aboutLabel.setObjectName("creditsAbout")
         infoLayout.addWidget(nameLabel)
         infoLayout.addWidget(aboutLabel)
         profileLayout.addLayout(infoLayout)
@@ -831,6 +2021,55 @@ class CreditsTab(QtWidgets.QWidget):
         layout.addStretch()
         self.setLayout(layout)
 
+    def loadProfilePixmap(self, url, cache_path):
+        """
+        Show the cached, pre-scaled profile picture if we have one. Otherwise show a
+        gray placeholder right away and fetch the image in the background.
+        """
+        pixmap = QtGui.QPixmap()
+        if QtCore.QFileInfo(cache_path).exists() and pixmap.load(cache_path):
+            self.profilePic.setPixmap(pixmap)
+            return
+        self.profilePic.setPixmap(fallback_avatar())
+        request = QtNetwork.QNetworkRequest(QtCore.QUrl(url))
+        request.setRawHeader(b"User-Agent", b"Mozilla/5.0")
+        request.setAttribute(QtNetwork.QNetworkRequest.CacheLoadControlAttribute,
+                             QtNetwork.QNetworkRequest.PreferCache)
+        request.setAttribute(QtNetwork.QNetworkRequest.Http2AllowedAttribute, True)
+        if hasattr(request, "setTransferTimeout"):  # Qt >= 5.15
+            # A stalled host just leaves the placeholder up instead of a request hanging forever
+            request.setTransferTimeout(PROFILE_IMAGE_TIMEOUT_MS)
+        reply = self.nam.get(request)
+        reply.finished.connect(lambda: self.onProfilePixmapDownloaded(reply, cache_path))
+
+    def onProfilePixmapDownloaded(self, reply, cache_path):
+        reply.deleteLater()
+        error = reply.error()
+        # Qt aborts timed-out transfers as OperationCanceledError
+        if error in (QtNetwork.QNetworkReply.TimeoutError, QtNetwork.QNetworkReply.OperationCanceledError):
+            print(f"Image download timed out after {PROFILE_IMAGE_TIMEOUT_MS} ms, keeping the placeholder")
+            return
+        if error != QtNetwork.QNetworkReply.NoError:
+            print("Image download failed:", reply.errorString())
+            return
+        # Decode straight to 100x100 rather than building a full-size pixmap just to shrink it
+        data = reply.readAll()
+        buffer = QtCore.QBuffer(data)
+        reader = QtGui.QImageReader(buffer)
+        size = reader.size()
+        if size.isValid():
+            size.scale(100, 100, QtCore.Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+        if image.isNull():
+            print("Image download failed: Failed to load image from data")
+            return
+        # Cache the scaled result so later launches skip both the download and the rescale
+        pixmap = QtGui.QPixmap.fromImage(image)
+        if not pixmap.save(cache_path, "PNG"):
+            print("Could not cache profile image to:", cache_path)
+        self.profilePic.setPixmap(pixmap)
+
 #############################
 # Main Application Window
 #############################
@@ -838,33 +2077,108 @@ class CompressorApp(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Multimedia Compressor")
-        self.setGeometry(100, 100, 600, 500)
-        self.setStyleSheet(modernStyle)
+        self.resize(600, 500)
+
+        # One worker pool shared by every tab. It already defaults to idealThreadCount()
+        # threads, and the tabs never queue more than one job at a time anyway.
+        self.pool = QtCore.QThreadPool.globalInstance()
+
+        # One network manager for every tab, so requests share connections and an HTTP cache
+        self.nam = QtNetwork.QNetworkAccessManager(self)
+        cache = QtNetwork.QNetworkDiskCache(self)
+        cache.setCacheDirectory(
+            QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation) + "/http")
+        self.nam.setCache(cache)
+        if not os.path.exists(profile_cache_path(PROFILE_IMAGE_URL)):
+            # The Credits avatar will need a download: resolve its host and finish the TLS
+            # handshake now, in the background, so the fetch itself only pays for the transfer
+            self.nam.connectToHostEncrypted(QtCore.QUrl(PROFILE_IMAGE_URL).host())
 
         self.tabWidget = QtWidgets.QTabWidget()
-        self.tabWidget.setStyleSheet("""
-            QTabWidget::pane { border: 1px solid #5e0080; }
-            QTabBar::tab { background: #282a2e; color: #c5c8c6; padding: 10px; border: 1px solid #373b41; border-bottom: none; border-top-left-radius: 4px; border-top-right-radius: 4px; }
-            QTabBar::tab:selected { background: #5e0080; }
-        """)
-
-        self.imageTab = ImageCompressorTab()
-        self.videoTab = VideoCompressorTab()
-        self.audioTab = AudioCompressorTab()
-        self.creditsTab = CreditsTab()
-
-        self.tabWidget.addTab(self.imageTab, "Image Compressor")
-        self.tabWidget.addTab(self.videoTab, "Video Compressor")
-        self.tabWidget.addTab(self.audioTab, "Audio Compressor")
-        self.tabWidget.addTab(self.creditsTab, "Credits")
+        # Four fixed tabs: no pane frame, tab-bar base line, scroll buttons, close buttons or dragging
+        self.tabWidget.setDocumentMode(True)
+        self.tabWidget.setUsesScrollButtons(False)
+        self.tabWidget.tabBar().setDrawBase(False)
+        self.tabWidget.setTabsClosable(False)
+        self.tabWidget.setMovable(False)
+        # The tab widget fills the window, so neither needs its background filled first
+        self.setAttribute(QtCore.Qt.WA_StyledBackground, False)
+        self.tabWidget.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+
+        # Tabs start as empty placeholders and are only built the first time they're shown
+        tabs = [
+            (functools.partial(ImageCompressorTab, pool=self.pool), "Image Compressor"),
+            (VideoCompressorTab, "Video Compressor"),
+            (functools.partial(AudioCompressorTab, pool=self.pool), "Audio Compressor"),
+            (functools.partial(CreditsTab, nam=self.nam), "Credits"),
+        ]
+        self.tabFactories = {}
+        # One repaint and no currentChanged for the whole batch
+        self.tabWidget.setUpdatesEnabled(False)
+        self.tabWidget.blockSignals(True)
+        try:
+            for index, (factory, label) in enumerate(tabs):
+                self.tabWidget.addTab(QtWidgets.QWidget(), label)
+                self.tabFactories[index] = factory
+        finally:
+            self.tabWidget.blockSignals(False)
+            self.tabWidget.setUpdatesEnabled(True)
+        self.tabWidget.currentChanged.connect(self.materializeTab)
+        # Build the visible tab from the event loop, so the window frame is shown first
+        QtCore.QTimer.singleShot(0, lambda: self.materializeTab(self.tabWidget.currentIndex()))
 
         self.setCentralWidget(self.tabWidget)
+        # Positioned once the widget tree is complete
+        self.move(100, 100)
+
+    def materializeTab(self, index):
+        factory = self.tabFactories.pop(index, None)
+        if factory is None:
+            return
+        widget = factory()
+        placeholder = self.tabWidget.widget(index)
+        label = self.tabWidget.tabText(index)
+        # Removing the current tab would select a neighbour and materialize it too
+        self.tabWidget.blockSignals(True)
+        self.tabWidget.removeTab(index)
+        self.tabWidget.insertTab(index, widget, label)
+        self.tabWidget.setCurrentIndex(index)
+        self.tabWidget.blockSignals(False)
+        placeholder.deleteLater()
 
 def main():
+    # Coalesce bursts of wheel/touch/update events, and don't give every child a native window
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_CompressHighFrequencyEvents, True)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_DontCreateNativeWidgetSiblings, True)
+    # Keep the exact device pixel ratio so cached pixmaps stay valid; all of this must precede QApplication
+    if hasattr(QtWidgets.QApplication, "setHighDpiScaleFactorRoundingPolicy"):  # Qt >= 5.14
+        QtWidgets.QApplication.setHighDpiScaleFactorRoundingPolicy(
+            QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
     app = QtWidgets.QApplication(sys.argv)
+    app.setApplicationName("MultimediaCompressor")
+    # Same family/size as modernStyle, resolved once instead of per widget
+    app.setFont(QtGui.QFont("Segoe UI", 10))
+    # Room for plenty of 800x600 previews; the default limit is only 10 MB
+    QtGui.QPixmapCache.setCacheLimit(128 * 1024)  # KB
+    # Needs the QApplication for its dialogs; the download can fail on a fresh install
+    global ffmpeg_exe, ffprobe_exe
+    try:
+        ffmpeg_exe, ffprobe_exe = setup_ffmpeg()
+    except Exception as e:
+        show_error_dialog("Error", "Could not set up ffmpeg. Place ffmpeg.exe and ffprobe.exe in "
+                                   f"the ffmpeg_bin folder, or check your connection and try again.\nError: {str(e)}")
+        sys.exit(1)
+    # Parsed once for the whole application instead of per widget hierarchy, and only after
+    # the window is up. Queued before CompressorApp posts its first tab, so that tab is only
+    # polished once, with the stylesheet already in place.
+    QtCore.QTimer.singleShot(0, lambda: app.setStyleSheet(modernStyle + "\n" + tabStyle))
     mainWin = CompressorApp()
     mainWin.show()
-    sys.exit(app.exec_())
+    QtCore.QTimer.singleShot(0, check_jpeg_codec)
+    # exec() without the underscore needs PyQt5 >= 5.15
+    sys.exit(getattr(app, "exec", app.exec_)())
 
 if __name__ == '__main__':
     main()
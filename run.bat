@@ -1,4 +1,5 @@
 @echo off
 echo Running Video/Image Compressor...
-python main.py
+REM Importing main (instead of running it as a script) lets Python cache its bytecode in __pycache__
+python -c "import main; main.main()"
 pause